@@ -17,39 +17,79 @@ import sys
 import io
 import json
 import textwrap
-import datetime
+import time
 import hashlib
+import functools
+import itertools
+import random
 import re
 from dataclasses import dataclass, field
 from typing import Optional, List, Tuple, Dict, Any
 from pathlib import Path
+from collections import namedtuple
 
 import click
 
-# optional libs (install via requirements.txt)
-try:
-    import pyfiglet
-except ImportError:
-    pyfiglet = None
-
-try:
-    from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance
-except ImportError:
-    Image = ImageDraw = ImageFont = ImageFilter = ImageEnhance = None
-
-try:
-    import yaml
-except ImportError:
-    yaml = None
-
-try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.syntax import Syntax
-    from rich.table import Table
-    console = Console()
-except ImportError:
-    console = None
+# optional libs (install via requirements.txt), imported on first use so
+# commands that don't need them start fast
+pyfiglet = None
+Image = ImageDraw = ImageFont = ImageFilter = None
+np = None
+yaml = _YamlDumper = None
+console = Panel = None
+
+def _import_pyfiglet() -> bool:
+    """Import pyfiglet on first use; False if not installed"""
+    global pyfiglet
+    if pyfiglet is None:
+        try:
+            import pyfiglet
+        except ImportError:
+            return False
+    return True
+
+def _import_pil() -> bool:
+    """Import Pillow on first use; False if not installed"""
+    global Image, ImageDraw, ImageFont, ImageFilter
+    if Image is None:
+        try:
+            from PIL import Image, ImageDraw, ImageFont, ImageFilter
+        except ImportError:
+            return False
+    return True
+
+def _import_numpy() -> bool:
+    """Import NumPy on first use; False if not installed"""
+    global np
+    if np is None:
+        try:
+            import numpy as np
+        except ImportError:
+            return False
+    return True
+
+def _import_yaml() -> bool:
+    """Import PyYAML on first use, preferring the LibYAML C emitter; False if not installed"""
+    global yaml, _YamlDumper
+    if yaml is None:
+        try:
+            import yaml
+        except ImportError:
+            return False
+        _YamlDumper = getattr(yaml, "CDumper", yaml.Dumper)
+    return True
+
+def _import_rich() -> bool:
+    """Import rich and create the console on first use; False if not installed"""
+    global console, Panel
+    if console is None:
+        try:
+            from rich.console import Console
+            from rich.panel import Panel
+        except ImportError:
+            return False
+        console = Console()
+    return True
 
 # ==================== CONSTANTS ====================
 
@@ -65,21 +105,50 @@ BANNER_ASCII = r"""
 
 # ==================== UTILITIES ====================
 
+# Spaces become underscores in generated filenames
+_SAFE_NAME_TABLE = str.maketrans({' ': '_'})
+
 def ensure_dir(path: str):
     """Create directory if it doesn't exist"""
     Path(path).mkdir(parents=True, exist_ok=True)
 
+def _write_fd(fd: int, data: bytes):
+    """Write all of data to fd, then close it"""
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def write_bytes(path: str, data: bytes):
+    """Write pre-encoded bytes straight to a file descriptor (no text IO layer)"""
+    _write_fd(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666), data)
+
 def hash_text(text: str) -> str:
     """Generate short hash for unique filenames"""
-    return hashlib.md5(text.encode()).hexdigest()[:8]
+    return hashlib.blake2b(text.encode(), digest_size=4).hexdigest()
+
+# Any CSI sequence (SGR colours, erase-line, cursor moves) in one pass
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
 
 def strip_ansi(text: str) -> str:
-    """Remove ANSI color codes from text"""
-    return re.sub(r'\033\[[0-9;]+m', '', text)
+    """Remove ANSI color and control codes from text"""
+    return _ANSI_RE.sub('', text)
+
+def pillow_backend() -> str:
+    """Describe the installed Pillow build (Pillow-SIMD tags its versions .postN)"""
+    if not _import_pil():
+        return "not installed"
+    import PIL
+    version = PIL.__version__
+    return f"Pillow-SIMD {version}" if ".post" in version else f"Pillow {version}"
 
 # ==================== COLOR PALETTES ====================
 
-PALETTES = {
+Palette = namedtuple("Palette", "bg accent text muted gradient_start gradient_end")
+
+_PALETTE_SPECS = {
     "stealth": {
         "bg": "#0a0f14", 
         "accent": "#00ffff", 
@@ -154,54 +223,80 @@ PALETTES = {
     }
 }
 
-def get_palette(name: str = "stealth") -> dict:
+# Resolved to immutable tuples once so renderers use attribute access
+PALETTES = {name: Palette(**spec) for name, spec in _PALETTE_SPECS.items()}
+
+def get_palette(name: str = "stealth") -> Palette:
     """Get palette by name with fallback"""
     return PALETTES.get(name, PALETTES["stealth"])
 
+def _as_palette(palette) -> Palette:
+    """Accept a Palette, a palette dict, or None (default palette)"""
+    if palette is None:
+        return get_palette()
+    if isinstance(palette, dict):
+        # Take just the Palette fields so caller dicts may carry extra keys
+        return Palette(*(palette[f] for f in Palette._fields))
+    return palette
+
 
 # ==================== SVG TEMPLATES ====================
 
-SVG_TEMPLATE_SIMPLE = """<?xml version="1.0" encoding="UTF-8"?>
-<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg" role="img" aria-label="{label}">
-  <defs>
-    <linearGradient id="grad1" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:{grad_start};stop-opacity:1" />
-      <stop offset="100%" style="stop-color:{grad_end};stop-opacity:1" />
-    </linearGradient>
-    {filters}
-  </defs>
-  <rect width="100%" height="100%" fill="{bg}" />
-  <!-- accent shapes -->
-  {accent}
-  <!-- main text -->
-  <text x="{x}" y="{y}" font-family="{font_family}" font-size="{font_size}" font-weight="700" fill="{text_fill}" text-anchor="middle" {text_style}>{text}</text>
-  <!-- subtitle -->
-  {subtitle}
-  {animation}
-</svg>
-"""
+SVG_FONT_FAMILY = "Orbitron,Inter,Arial"
+SVG_GLOW_FILTER = '<filter id="glow"><feGaussianBlur stdDeviation="2" result="coloredBlur"/><feMerge><feMergeNode in="coloredBlur"/><feMergeNode in="SourceGraphic"/></feMerge></filter>'
 
-SVG_ANIMATED_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
-<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg">
-  <defs>
-    <linearGradient id="animGrad" x1="0%" y1="0%" x2="100%" y2="0%">
-      <stop offset="0%" style="stop-color:{grad_start}">
-        <animate attributeName="stop-color" values="{grad_start};{grad_end};{grad_start}" dur="3s" repeatCount="indefinite"/>
-      </stop>
-      <stop offset="100%" style="stop-color:{grad_end}">
-        <animate attributeName="stop-color" values="{grad_end};{grad_start};{grad_end}" dur="3s" repeatCount="indefinite"/>
-      </stop>
-    </linearGradient>
-  </defs>
-  <rect width="100%" height="100%" fill="{bg}"/>
-  {accent}
-  <text x="{x}" y="{y}" font-family="{font_family}" font-size="{font_size}" font-weight="700" fill="url(#animGrad)" text-anchor="middle">
-    {text}
-    <animate attributeName="opacity" values="0.8;1;0.8" dur="2s" repeatCount="indefinite"/>
-  </text>
-  {subtitle}
-</svg>
-"""
+def _svg_simple_parts(width: int, height: int, palette: Palette, accent: str,
+                      text: str, subtitle_tag: str, text_style: str) -> List[str]:
+    """Static SVG document as literal fragments interleaved with values"""
+    return [
+        '<?xml version="1.0" encoding="UTF-8"?>\n',
+        f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg" role="img" aria-label="',
+        text, '">\n',
+        '  <defs>\n',
+        '    <linearGradient id="grad1" x1="0%" y1="0%" x2="100%" y2="100%">\n',
+        f'      <stop offset="0%" style="stop-color:{palette.gradient_start};stop-opacity:1" />\n',
+        f'      <stop offset="100%" style="stop-color:{palette.gradient_end};stop-opacity:1" />\n',
+        '    </linearGradient>\n',
+        '    ', SVG_GLOW_FILTER, '\n',
+        '  </defs>\n',
+        f'  <rect width="100%" height="100%" fill="{palette.bg}" />\n',
+        '  <!-- accent shapes -->\n',
+        '  ', accent, '\n',
+        '  <!-- main text -->\n',
+        f'  <text x="{width//2}" y="{int(height*0.55)}" font-family="{SVG_FONT_FAMILY}" font-size="{int(height*0.2)}" font-weight="700" fill="{palette.text}" text-anchor="middle" {text_style}>',
+        text, '</text>\n',
+        '  <!-- subtitle -->\n',
+        '  ', subtitle_tag, '\n',
+        '  \n',
+        '</svg>\n',
+    ]
+
+def _svg_animated_parts(width: int, height: int, palette: Palette, accent: str,
+                        text: str, subtitle_tag: str) -> List[str]:
+    """Animated SVG document as literal fragments interleaved with values"""
+    grad_start, grad_end = palette.gradient_start, palette.gradient_end
+    return [
+        '<?xml version="1.0" encoding="UTF-8"?>\n',
+        f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg">\n',
+        '  <defs>\n',
+        '    <linearGradient id="animGrad" x1="0%" y1="0%" x2="100%" y2="0%">\n',
+        f'      <stop offset="0%" style="stop-color:{grad_start}">\n',
+        f'        <animate attributeName="stop-color" values="{grad_start};{grad_end};{grad_start}" dur="3s" repeatCount="indefinite"/>\n',
+        '      </stop>\n',
+        f'      <stop offset="100%" style="stop-color:{grad_end}">\n',
+        f'        <animate attributeName="stop-color" values="{grad_end};{grad_start};{grad_end}" dur="3s" repeatCount="indefinite"/>\n',
+        '      </stop>\n',
+        '    </linearGradient>\n',
+        '  </defs>\n',
+        f'  <rect width="100%" height="100%" fill="{palette.bg}"/>\n',
+        '  ', accent, '\n',
+        f'  <text x="{width//2}" y="{int(height*0.55)}" font-family="{SVG_FONT_FAMILY}" font-size="{int(height*0.2)}" font-weight="700" fill="url(#animGrad)" text-anchor="middle">\n',
+        '    ', text, '\n',
+        '    <animate attributeName="opacity" values="0.8;1;0.8" dur="2s" repeatCount="indefinite"/>\n',
+        '  </text>\n',
+        '  ', subtitle_tag, '\n',
+        '</svg>\n',
+    ]
 
 def svg_accent_wave(width: int, height: int, color: str, opacity: float = 0.12) -> str:
     """Generate decorative wave accent"""
@@ -220,178 +315,248 @@ def svg_accent_geometric(width: int, height: int, color: str, opacity: float = 0
 
 def svg_accent_grid(width: int, height: int, color: str, opacity: float = 0.05) -> str:
     """Generate grid pattern accent"""
-    lines = []
     spacing = 50
-    for x in range(0, width, spacing):
-        lines.append(f'<line x1="{x}" y1="0" x2="{x}" y2="{height}" stroke="{color}" opacity="{opacity}"/>')
-    for y in range(0, height, spacing):
-        lines.append(f'<line x1="0" y1="{y}" x2="{width}" y2="{y}" stroke="{color}" opacity="{opacity}"/>')
-    return '\n  '.join(lines)
+    vertical = (f'<line x1="{x}" y1="0" x2="{x}" y2="{height}" stroke="{color}" opacity="{opacity}"/>'
+                for x in range(0, width, spacing))
+    horizontal = (f'<line x1="0" y1="{y}" x2="{width}" y2="{y}" stroke="{color}" opacity="{opacity}"/>'
+                  for y in range(0, height, spacing))
+    return '\n  '.join(itertools.chain(vertical, horizontal))
+
+@functools.lru_cache(maxsize=16)
+def _particle_coords(width: int, height: int, n: int = 30, seed: int = 42) -> Tuple[Tuple[int, int, int], ...]:
+    """Deterministic (x, y, r) particle positions, without reseeding the global RNG"""
+    rng = random.Random(seed)
+    return tuple((rng.randint(0, width), rng.randint(0, height), rng.randint(2, 8)) for _ in range(n))
 
 def svg_accent_particles(width: int, height: int, color: str, opacity: float = 0.08) -> str:
     """Generate particle/dot pattern accent"""
-    import random
-    random.seed(42)  # Deterministic
-    particles = []
-    for _ in range(30):
-        x = random.randint(0, width)
-        y = random.randint(0, height)
-        r = random.randint(2, 8)
-        particles.append(f'<circle cx="{x}" cy="{y}" r="{r}" fill="{color}" opacity="{opacity}"/>')
-    return '\n  '.join(particles)
+    return '\n  '.join(f'<circle cx="{x}" cy="{y}" r="{r}" fill="{color}" opacity="{opacity}"/>'
+                       for x, y, r in _particle_coords(width, height))
 
-def write_svg(path: str, text: str, subtitle: Optional[str], width: int = 1200, 
-              height: int = 300, palette: dict = None, style: str = "wave",
-              animated: bool = False):
-    """Write SVG banner with various styles"""
-    if palette is None:
-        palette = get_palette()
-    
-    # Choose accent style
-    accent_map = {
-        "wave": svg_accent_wave,
-        "geometric": svg_accent_geometric,
-        "grid": svg_accent_grid,
-        "particles": svg_accent_particles
-    }
-    accent_func = accent_map.get(style, svg_accent_wave)
-    accent = accent_func(width, height, palette["accent"])
-    
-    # Subtitle
-    subtitle_tag = ""
-    if subtitle:
-        subtitle_tag = f'<text x="{width//2}" y="{int(height*0.78)}" font-family="Inter,Arial,Helvetica" font-size="{int(height*0.075)}" fill="{palette["muted"]}" text-anchor="middle">{subtitle}</text>'
+SVG_ACCENTS = {
+    "wave": svg_accent_wave,
+    "geometric": svg_accent_geometric,
+    "grid": svg_accent_grid,
+    "particles": svg_accent_particles
+}
+
+# Placeholders for the per-banner values in a specialized writer
+_TEXT_SLOT = object()
+_SUBTITLE_SLOT = object()
+
+@functools.lru_cache(maxsize=64)
+def _svg_writer(width: int, height: int, palette: Palette, style: str, animated: bool):
+    """
+    Specialize SVG output for one (size, palette, style, animated) shape.
+    Accents, coordinates and markup are evaluated and encoded once; the
+    returned function only splices in the title and subtitle bytes.
+    """
+    accent = SVG_ACCENTS.get(style, svg_accent_wave)(width, height, palette.accent)
     
-    # Choose template
     if animated:
-        template = SVG_ANIMATED_TEMPLATE
-        svg = template.format(
-            width=width, height=height, bg=palette["bg"],
-            grad_start=palette["gradient_start"], grad_end=palette["gradient_end"],
-            accent=accent, x=width//2, y=int(height*0.55),
-            font_family="Orbitron,Inter,Arial", font_size=int(height*0.2),
-            text=text, subtitle=subtitle_tag
-        )
+        parts = _svg_animated_parts(width, height, palette, accent, _TEXT_SLOT, _SUBTITLE_SLOT)
     else:
-        filters = '<filter id="glow"><feGaussianBlur stdDeviation="2" result="coloredBlur"/><feMerge><feMergeNode in="coloredBlur"/><feMergeNode in="SourceGraphic"/></feMerge></filter>'
         text_style = 'filter="url(#glow)"' if style == "glow" else ''
-        svg = SVG_TEMPLATE_SIMPLE.format(
-            width=width, height=height, label=text, bg=palette["bg"],
-            grad_start=palette["gradient_start"], grad_end=palette["gradient_end"],
-            filters=filters, accent=accent, x=width//2, y=int(height*0.55),
-            font_family="Orbitron,Inter,Arial", font_size=int(height*0.2),
-            text_fill=palette["text"], text=text, subtitle=subtitle_tag,
-            text_style=text_style, animation=""
-        )
-    
-    with open(path, "w", encoding="utf-8") as fh:
-        fh.write(svg)
+        parts = _svg_simple_parts(width, height, palette, accent, _TEXT_SLOT, _SUBTITLE_SLOT, text_style)
+    
+    # Collapse each run of literal fragments into one pre-encoded chunk
+    chunks = []
+    for is_literal, group in itertools.groupby(parts, key=lambda p: isinstance(p, str)):
+        if is_literal:
+            chunks.append("".join(group).encode("utf-8"))
+        else:
+            chunks.extend(group)
+    
+    sub_open = f'<text x="{width//2}" y="{int(height*0.78)}" font-family="Inter,Arial,Helvetica" font-size="{int(height*0.075)}" fill="{palette.muted}" text-anchor="middle">'.encode("utf-8")
+    
+    def render(text: str, subtitle: Optional[str]) -> bytes:
+        text_bytes = text.encode("utf-8")
+        subtitle_bytes = b"".join((sub_open, subtitle.encode("utf-8"), b"</text>")) if subtitle else b""
+        return b"".join(text_bytes if c is _TEXT_SLOT else subtitle_bytes if c is _SUBTITLE_SLOT else c
+                        for c in chunks)
+    
+    return render
+
+def write_svg(path: str, text: str, subtitle: Optional[str], width: int = 1200, 
+              height: int = 300, palette: Palette = None, style: str = "wave",
+              animated: bool = False):
+    """Write SVG banner with various styles"""
+    palette = _as_palette(palette)
+    writer = _svg_writer(width, height, palette, style, animated)
+    write_bytes(path, writer(text, subtitle))
 
 # ==================== PNG RENDERING ====================
 
+FONT_CANDIDATES = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",
+    "C:\\Windows\\Fonts\\arialbd.ttf",
+    "/usr/share/fonts/TTF/DejaVuSans-Bold.ttf"
+]
+
+@functools.lru_cache(maxsize=None)
+def _default_font_path() -> Optional[str]:
+    """First candidate FreeType can actually load; probed once per process"""
+    for c in FONT_CANDIDATES:
+        if os.path.isfile(c):
+            try:
+                ImageFont.truetype(c)
+                return c
+            except OSError:
+                continue
+    return None
+
+@functools.lru_cache(maxsize=32)
+def _load_font(font_path: Optional[str], size: int):
+    """Load (and cache) a TrueType font, falling back to the default system font"""
+    if font_path and os.path.isfile(font_path):
+        return ImageFont.truetype(font_path, size=size)
+    path = _default_font_path()
+    if path:
+        try:
+            return ImageFont.truetype(path, size=size)
+        except (OSError, ValueError):  # e.g. size 0 on very short banners
+            pass
+    return ImageFont.load_default()
+
+# Small on purpose: titles rarely repeat across banners, so this only needs
+# to hold one banner's title and subtitle while its effects reuse them
+@functools.lru_cache(maxsize=8)
+def _text_coverage(text: str, font_path: Optional[str], size: int) -> Tuple[Any, Tuple[int, int]]:
+    """
+    Rasterize text once into an "L" coverage mask cropped to its bbox.
+    Returns the mask and the bbox offset from the draw origin.
+    """
+    font = _load_font(font_path, size)
+    bbox = font.getbbox(text)
+    coverage = Image.new("L", (max(1, bbox[2] - bbox[0]), max(1, bbox[3] - bbox[1])), 0)
+    ImageDraw.Draw(coverage).text((-bbox[0], -bbox[1]), text, font=font, fill=255)
+    return coverage, (bbox[0], bbox[1])
+
+def _render_text_mask(text: str, font_path: Optional[str], size: int, fill) -> Tuple[Any, Tuple[int, int]]:
+    """
+    Colour the cached coverage mask with fill. Shadow, glow and main text
+    share a single FreeType layout; the coloured layer is built per call.
+    """
+    coverage, offset = _text_coverage(text, font_path, size)
+    mask = Image.new("RGBA", coverage.size, fill)
+    fill_alpha = mask.getpixel((0, 0))[3]
+    mask.putalpha(coverage if fill_alpha == 255 else coverage.point(lambda v: v * fill_alpha // 255))
+    return mask, offset
+
+def _fill_gradient(buf, accent_rgb: Tuple[int, int, int]):
+    """Fill an (H, W, 4) uint8 buffer in place with the accent fading out top to bottom"""
+    height = buf.shape[0]
+    buf[..., :3] = accent_rgb
+    buf[..., 3] = (50 * (1 - np.arange(height) / height)).astype(np.uint8)[:, None]
+
+def _composite_at(img, layer, x: int, y: int):
+    """Alpha-composite layer over img at (x, y), clipping any part off the top/left edge"""
+    sx, sy = max(0, -x), max(0, -y)
+    if sx >= layer.width or sy >= layer.height:
+        return
+    img.alpha_composite(layer, dest=(x + sx, y + sy), source=(sx, sy))
+
+@functools.lru_cache(maxsize=16)
+def _make_gradient(width: int, height: int, accent_rgb: Tuple[int, int, int]):
+    """Top-down accent fade as a read-only (H, W, 4) uint8 array, shared across banners"""
+    arr = np.empty((height, width, 4), dtype=np.uint8)
+    _fill_gradient(arr, accent_rgb)
+    arr.flags.writeable = False
+    return arr
+
 def render_png_text(path: str, text: str, subtitle: Optional[str] = None, 
-                   width: int = 1200, height: int = 300, palette: dict = None, 
-                   font_path: Optional[str] = None, effects: List[str] = None):
+                   width: int = 1200, height: int = 300, palette: Palette = None, 
+                   font_path: Optional[str] = None, effects: List[str] = None,
+                   compress_level: int = 6):
     """Render PNG with optional effects (glow, shadow, gradient)"""
-    if Image is None:
+    if not _import_pil():
         raise RuntimeError("Pillow is required. Install: pip install pillow")
     
-    if palette is None:
-        palette = get_palette()
+    palette = _as_palette(palette)
     
     if effects is None:
         effects = []
     
     # Create base image
-    img = Image.new("RGBA", (width, height), palette["bg"])
+    img = Image.new("RGBA", (width, height), palette.bg)
     
     # Add gradient background if requested
     if "gradient" in effects:
-        for y in range(height):
-            alpha = int(50 * (1 - y / height))
-            for x in range(width):
-                img.putpixel((x, y), (*_hex_to_rgb(palette["accent"]), alpha))
+        if not _import_numpy():
+            raise RuntimeError("NumPy is required for the gradient effect. Install: pip install numpy")
+        arr = _make_gradient(width, height, _hex_to_rgb(palette.accent))
+        img = Image.alpha_composite(img, Image.fromarray(arr, "RGBA"))
     
-    draw = ImageDraw.Draw(img)
+    title_size = int(height * 0.22)
+    subtitle_size = int(height * 0.07)
     
-    def load_font(size: int):
-        if font_path and os.path.isfile(font_path):
-            return ImageFont.truetype(font_path, size=size)
-        
-        candidates = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",
-            "C:\\Windows\\Fonts\\arialbd.ttf",
-            "/usr/share/fonts/TTF/DejaVuSans-Bold.ttf"
-        ]
-        for c in candidates:
-            if os.path.isfile(c):
-                try:
-                    return ImageFont.truetype(c, size=size)
-                except:
-                    continue
-        return ImageFont.load_default()
-    
-    title_font = load_font(int(height * 0.22))
-    subtitle_font = load_font(int(height * 0.07))
-    
-    # Calculate text position
-    bbox = draw.textbbox((0, 0), text, font=title_font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-    x = (width - text_width) / 2
-    y = height * 0.35 - text_height / 2
+    # Calculate text position (masks are cropped to the text bbox)
+    title_mask, (ox, oy) = _render_text_mask(text, font_path, title_size, palette.text)
+    x = int((width - title_mask.width) / 2 + ox)
+    y = int(height * 0.35 - title_mask.height / 2 + oy)
     
     # Add shadow effect
     if "shadow" in effects:
         shadow_offset = 4
-        draw.text((x + shadow_offset, y + shadow_offset), text, 
-                 font=title_font, fill=(0, 0, 0, 128))
+        shadow_mask, _ = _render_text_mask(text, font_path, title_size, (0, 0, 0, 128))
+        _composite_at(img, shadow_mask, x + shadow_offset, y + shadow_offset)
     
-    # Add glow effect (multiple passes)
+    # Add glow effect (blurred copy of the title under the sharp text)
     if "glow" in effects:
-        glow_color = (*_hex_to_rgb(palette["accent"]), 80)
-        for offset in range(3, 0, -1):
-            draw.text((x - offset, y), text, font=title_font, fill=glow_color)
-            draw.text((x + offset, y), text, font=title_font, fill=glow_color)
-            draw.text((x, y - offset), text, font=title_font, fill=glow_color)
-            draw.text((x, y + offset), text, font=title_font, fill=glow_color)
+        glow_mask, _ = _render_text_mask(text, font_path, title_size,
+                                         (*_hex_to_rgb(palette.accent), 180))
+        glow_layer = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        glow_layer.paste(glow_mask, (x, y))
+        glow_layer = glow_layer.filter(ImageFilter.GaussianBlur(radius=4))
+        img = Image.alpha_composite(img, glow_layer)
     
     # Draw main text
-    draw.text((x, y), text, font=title_font, fill=palette["text"])
+    _composite_at(img, title_mask, x, y)
     
     # Draw subtitle
     if subtitle:
-        sub_bbox = draw.textbbox((0, 0), subtitle, font=subtitle_font)
-        sub_width = sub_bbox[2] - sub_bbox[0]
-        sub_height = sub_bbox[3] - sub_bbox[1]
-        sub_x = (width - sub_width) / 2
-        sub_y = height * 0.75 - sub_height / 2
-        draw.text((sub_x, sub_y), subtitle, font=subtitle_font, fill=palette["muted"])
+        sub_mask, (sub_ox, sub_oy) = _render_text_mask(subtitle, font_path, subtitle_size,
+                                                        palette.muted)
+        sub_x = int((width - sub_mask.width) / 2 + sub_ox)
+        sub_y = int(height * 0.75 - sub_mask.height / 2 + sub_oy)
+        _composite_at(img, sub_mask, sub_x, sub_y)
+    
+    draw = ImageDraw.Draw(img)
     
     # Add accent stripe
     if "stripe" in effects:
-        stripe_color = (*_hex_to_rgb(palette["accent"]), 68)
+        stripe_color = (*_hex_to_rgb(palette.accent), 68)
         draw.rectangle([(0, int(height * 0.85)), (width, height)], fill=stripe_color)
     
     # Apply blur filter for softer look
     if "blur" in effects and ImageFilter:
         img = img.filter(ImageFilter.GaussianBlur(radius=1))
     
-    img.save(path)
+    # Encode in memory, then hand the file a single write
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", compress_level=compress_level)
+    write_bytes(path, buf.getvalue())
 
+# #rrggbb or #rrggbbaa (the alpha pair is accepted, as Pillow does, but ignored)
+_HEX_RGB_RE = re.compile(r'[0-9a-fA-F]{6}(?:[0-9a-fA-F]{2})?')
+
+@functools.lru_cache(maxsize=64)
 def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """Convert hex color to RGB tuple"""
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    digits = hex_color.lstrip('#')
+    if not _HEX_RGB_RE.fullmatch(digits):
+        raise ValueError(f"Invalid hex color {hex_color!r}: expected #rrggbb or #rrggbbaa")
+    v = int(digits[:6], 16)
+    return (v >> 16 & 0xff, v >> 8 & 0xff, v & 0xff)
 
 # ==================== ASCII BANNERS ====================
 
 def ascii_banner(text: str, font: str = "standard", colorize: bool = False, 
                 color: str = "cyan") -> str:
     """Generate ASCII banner with optional ANSI colors"""
-    if pyfiglet is None:
+    if not _import_pyfiglet():
         raise RuntimeError("pyfiglet is required. Install: pip install pyfiglet")
     
     fig = pyfiglet.Figlet(font=font)
@@ -415,7 +580,7 @@ def ascii_banner(text: str, font: str = "standard", colorize: bool = False,
 
 def list_figlet_fonts() -> List[str]:
     """List available figlet fonts"""
-    if pyfiglet is None:
+    if not _import_pyfiglet():
         return []
     return pyfiglet.FigletFont.getFonts()
 
@@ -452,7 +617,9 @@ def gemini_generate_taglines(prompt: str, n: int = 3, api_key: Optional[str] = N
 
 # ==================== TEMPLATES ====================
 
-TEMPLATES = {
+Template = namedtuple("Template", "style palette effects")
+
+_TEMPLATE_SPECS = {
     "minimal": {
         "style": "wave",
         "palette": "stealth",
@@ -485,6 +652,47 @@ TEMPLATES = {
     }
 }
 
+TEMPLATES = {name: Template(spec["style"], spec["palette"], tuple(spec["effects"]))
+             for name, spec in _TEMPLATE_SPECS.items()}
+
+# ==================== EXAMPLES ====================
+
+# Sample batch spec written by the `example` command
+EXAMPLE_CONFIGS = [
+    {
+        "kind": "svg",
+        "text": "BannerForge",
+        "subtitle": "Ultimate Banner Creator",
+        "width": 1200,
+        "height": 300,
+        "palette": "stealth",
+        "style": "wave",
+        "animated": False
+    },
+    {
+        "kind": "png",
+        "text": "Tech Conference 2025",
+        "subtitle": "Innovation & Future",
+        "width": 1920,
+        "height": 400,
+        "palette": "neon",
+        "effects": ["glow", "shadow"]
+    },
+    {
+        "kind": "ascii",
+        "text": "Welcome",
+        "font": "slant"
+    },
+    {
+        "kind": "svg",
+        "text": "Open Source",
+        "subtitle": "Built by the Community",
+        "palette": "forest",
+        "style": "geometric",
+        "animated": True
+    }
+]
+
 # ==================== CLI COMMANDS ====================
 
 @click.group(help="BannerForge — Banner Creator By @Kdairatchi (ASCII + SVG + PNG)")
@@ -513,8 +721,7 @@ def ascii(text, font, color, colorize, out, list_fonts):
     
     if out:
         # Strip ANSI codes when writing to file
-        import re
-        clean_banner = re.sub(r'\033\[[0-9;]+m', '', banner)
+        clean_banner = strip_ansi(banner)
         with open(out, "w", encoding="utf-8") as fh:
             fh.write(clean_banner)
         click.echo(f"✓ Wrote ASCII banner to {out}")
@@ -540,8 +747,8 @@ def svg(text, subtitle, width, height, palette, style, animated, template, out,
     # Apply template if specified
     if template:
         tmpl = TEMPLATES[template]
-        style = tmpl["style"]
-        palette = tmpl["palette"]
+        style = tmpl.style
+        palette = tmpl.palette
     
     pal = get_palette(palette)
     
@@ -551,8 +758,8 @@ def svg(text, subtitle, width, height, palette, style, animated, template, out,
         click.echo(f"AI suggestion: {subtitle}")
     
     if out is None:
-        timestamp = datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        safe_text = text.replace(' ', '_')[:30]
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+        safe_text = text[:30].translate(_SAFE_NAME_TABLE)
         out = f"banner_{safe_text}_{timestamp}.svg"
     
     ensure_dir(os.path.dirname(out) or ".")
@@ -580,8 +787,8 @@ def png(text, subtitle, width, height, palette, effects, template, out, font, ai
     # Apply template if specified
     if template:
         tmpl = TEMPLATES[template]
-        palette = tmpl["palette"]
-        effects = tmpl["effects"]
+        palette = tmpl.palette
+        effects = tmpl.effects
     
     pal = get_palette(palette)
     
@@ -591,8 +798,8 @@ def png(text, subtitle, width, height, palette, effects, template, out, font, ai
         click.echo(f"AI suggestion: {subtitle}")
     
     if out is None:
-        timestamp = datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        safe_text = text.replace(' ', '_')[:30]
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+        safe_text = text[:30].translate(_SAFE_NAME_TABLE)
         out = f"banner_{safe_text}_{timestamp}.png"
     
     ensure_dir(os.path.dirname(out) or ".")
@@ -609,11 +816,23 @@ def png(text, subtitle, width, height, palette, effects, template, out, font, ai
 @click.option("--ai", is_flag=True, default=False, help="use AI suggestions")
 def combo(text, subtitle, prefix, template, ai):
     """Generate ASCII + SVG + PNG combo"""
-    timestamp = datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
     folder = prefix or f"banners_{timestamp}"
     ensure_dir(folder)
     
-    safe_name = text.replace(' ', '_')[:30]
+    safe_name = text[:30].translate(_SAFE_NAME_TABLE)
+    
+    # Resolve template, palette and subtitle once for both renderers
+    if template:
+        tmpl = TEMPLATES[template]
+        style, pal, effects = tmpl.style, get_palette(tmpl.palette), tmpl.effects
+    else:
+        style, pal, effects = "wave", get_palette(), []
+    
+    if ai and subtitle is None:
+        ideas = gemini_generate_taglines(f"Create subtitle for banner: '{text}'", n=1)
+        subtitle = ideas[0]
+        click.echo(f"AI suggestion: {subtitle}")
     
     # ASCII
     ascii_path = os.path.join(folder, f"{safe_name}.txt")
@@ -623,81 +842,158 @@ def combo(text, subtitle, prefix, template, ai):
     
     # SVG
     svg_path = os.path.join(folder, f"{safe_name}.svg")
-    ctx = click.Context(svg)
-    ctx.invoke(svg, text=text, subtitle=subtitle, out=svg_path, 
-              template=template, ai=ai)
+    write_svg(svg_path, text, subtitle, palette=pal, style=style, animated=False)
+    click.echo(f"✓ SVG: {svg_path}")
     
     # PNG
     png_path = os.path.join(folder, f"{safe_name}.png")
-    ctx = click.Context(png)
-    ctx.invoke(png, text=text, subtitle=subtitle, out=png_path, 
-              template=template, ai=ai)
+    render_png_text(png_path, text, subtitle, palette=pal, effects=list(effects))
+    click.echo(f"✓ PNG: {png_path}")
     
     click.echo(f"\nGenerated combo in: {folder}")
 
+BATCH_EXTENSIONS = {"ascii": "txt", "svg": "svg", "png": "png"}
+
+def _output_path(item: Dict[str, Any], outdir: str) -> str:
+    """Output file for a batch spec entry"""
+    kind = item.get("kind", "svg")
+    if kind not in BATCH_EXTENSIONS:
+        raise ValueError(f"Unknown banner kind: {kind}")
+    safe_name = item["text"][:30].translate(_SAFE_NAME_TABLE)
+    return os.path.join(outdir, f"{safe_name}.{BATCH_EXTENSIONS[kind]}")
+
+def _compress_level(item: Dict[str, Any]) -> int:
+    """zlib level for a batch PNG entry; batch defaults to the fast level 1"""
+    raw = item.get("compress_level", 1)
+    if isinstance(raw, bool) or not isinstance(raw, int) or not 0 <= raw <= 9:
+        raise ValueError(f"compress_level must be an integer between 0 and 9, got {raw!r}")
+    return raw
+
+def _render_one(item: Dict[str, Any], outdir: str) -> str:
+    """Render a single batch spec entry; top-level so worker processes can pickle it"""
+    kind = item.get("kind", "svg")
+    text = item["text"]
+    subtitle = item.get("subtitle")
+    palette = item.get("palette", "stealth")
+    width = int(item.get("width", 1200))
+    height = int(item.get("height", 300))
+    path = _output_path(item, outdir)
+    
+    if kind == "ascii":
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(ascii_banner(text, font=item.get("font", "standard")))
+    
+    elif kind == "svg":
+        write_svg(path, text, subtitle, width=width, height=height, 
+                 palette=get_palette(palette),
+                 style=item.get("style", "wave"),
+                 animated=item.get("animated", False))
+    
+    elif kind == "png":
+        render_png_text(path, text, subtitle, width=width, height=height, 
+                      palette=get_palette(palette),
+                      font_path=item.get("font_path"),
+                      effects=item.get("effects", []),
+                      compress_level=_compress_level(item))
+    
+    return path
+
+def _render_group(items: List[Dict[str, Any]], outdir: str) -> List[str]:
+    """
+    Render entries in order, naming the entry that fails. Entries whose
+    paths differ only by case share a group, so they never run at once.
+    """
+    paths = []
+    for item in items:
+        try:
+            paths.append(_render_one(item, outdir))
+        except Exception as e:
+            raise click.ClickException(
+                f"Failed to render {item.get('kind', 'svg')} entry {item['text']!r}: {e}")
+    return paths
+
+def _iter_batch(groups: List[List[Dict[str, Any]]], outdir: str, jobs: Optional[int]):
+    """Yield (item, path) as entries finish; a pool is only worth it for several groups"""
+    if jobs == 1 or len(groups) <= 1:
+        for group in groups:
+            yield from zip(group, _render_group(group, outdir))
+        return
+    
+    # Banners are independent, so render them in parallel worker processes
+    # (imported here: multiprocessing is too heavy to load for every command)
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    with ProcessPoolExecutor(max_workers=jobs) as ex:
+        futures = {ex.submit(_render_group, group, outdir): group for group in groups}
+        try:
+            for future in as_completed(futures):
+                yield from zip(futures[future], future.result())
+        except BaseException:
+            # Fail fast like a serial run: drop everything not yet started
+            for future in futures:
+                future.cancel()
+            raise
+
 @cli.command(help="Batch generate from JSON/YAML file")
 @click.argument("spec", type=click.Path(exists=True))
 @click.option("--outdir", "-o", default="batch_banners", help="output directory")
-def batch(spec, outdir):
+@click.option("--jobs", "-j", default=None, type=click.IntRange(min=1),
+              help="worker processes (defaults to CPU count)")
+def batch(spec, outdir, jobs):
     """Batch process multiple banners from config file"""
     # Load spec file
     with open(spec, "r", encoding="utf-8") as fh:
         if spec.endswith('.yaml') or spec.endswith('.yml'):
-            if yaml is None:
+            if not _import_yaml():
                 raise RuntimeError("PyYAML required for YAML. Install: pip install pyyaml")
             data = yaml.safe_load(fh)
         else:
             data = json.load(fh)
     
+    # Validate every entry before rendering anything
+    paths = []
+    for idx, item in enumerate(data, 1):
+        try:
+            paths.append(_output_path(item, outdir))
+            if item.get("kind", "svg") == "png":
+                _compress_level(item)
+        except KeyError as e:
+            raise click.ClickException(f"Spec entry {idx} is missing required key {e}")
+        except ValueError as e:
+            raise click.ClickException(f"Spec entry {idx} ({item.get('text')!r}): {e}")
+    
     ensure_dir(outdir)
     
-    for idx, item in enumerate(data, 1):
-        kind = item.get("kind", "svg")
-        text = item["text"]
-        subtitle = item.get("subtitle")
-        palette = item.get("palette", "stealth")
-        width = int(item.get("width", 1200))
-        height = int(item.get("height", 300))
-        safe_name = text.replace(" ", "_")[:30]
-        
-        click.echo(f"[{idx}/{len(data)}] Generating {kind}: {text}")
-        
-        if kind == "ascii":
-            path = os.path.join(outdir, f"{safe_name}.txt")
-            with open(path, "w", encoding="utf-8") as fh:
-                fh.write(ascii_banner(text, font=item.get("font", "standard")))
-        
-        elif kind == "svg":
-            path = os.path.join(outdir, f"{safe_name}.svg")
-            write_svg(path, text, subtitle, width=width, height=height, 
-                     palette=get_palette(palette),
-                     style=item.get("style", "wave"),
-                     animated=item.get("animated", False))
-        
-        elif kind == "png":
-            path = os.path.join(outdir, f"{safe_name}.png")
-            render_png_text(path, text, subtitle, width=width, height=height, 
-                          palette=get_palette(palette),
-                          font_path=item.get("font_path"),
-                          effects=item.get("effects", []))
-        
-        click.echo(f"  ✓ {path}")
+    # Entries sharing an output file would race in parallel; as in a serial
+    # run the last one wins, so only that one is rendered
+    last = {path: idx for idx, path in enumerate(paths)}
+    groups = {}
+    for idx, (item, path) in enumerate(zip(data, paths)):
+        if last[path] == idx:
+            # Paths equal up to case may be one file (macOS/Windows): render in order
+            groups.setdefault(os.path.normcase(path).casefold(), []).append(item)
+        else:
+            click.echo(f"  - skipping {item.get('kind', 'svg')}: {item['text']} "
+                       f"({path} is overwritten by a later entry)")
+    total = sum(len(group) for group in groups.values())
+    
+    for idx, (item, path) in enumerate(_iter_batch(list(groups.values()), outdir, jobs), 1):
+        click.echo(f"[{idx}/{total}] ✓ {item.get('kind', 'svg')}: {path}")
     
-    click.echo(f"\nBatch complete: {len(data)} banners in {outdir}")
+    click.echo(f"\nBatch complete: {total} banners in {outdir}")
 
 @cli.command(help="List available palettes and templates")
 def info():
     """Show available palettes, templates, and fonts"""
     click.echo("Available Palettes:")
     for name, pal in PALETTES.items():
-        click.echo(f"  {name:12} - bg:{pal['bg']} accent:{pal['accent']}")
+        click.echo(f"  {name:12} - bg:{pal.bg} accent:{pal.accent}")
     
     click.echo("\nAvailable Templates:")
     for name, tmpl in TEMPLATES.items():
-        click.echo(f"  {name:12} - {tmpl['palette']} palette, {tmpl['style']} style")
+        click.echo(f"  {name:12} - {tmpl.palette} palette, {tmpl.style} style")
     
     click.echo("\nSample Figlet Fonts:")
-    if pyfiglet:
+    if _import_pyfiglet():
         sample_fonts = ["standard", "slant", "banner", "big", "digital", "block"]
         for f in sample_fonts:
             if f in list_figlet_fonts():
@@ -705,6 +1001,8 @@ def info():
     else:
         click.echo("  (Install pyfiglet to see fonts)")
     
+    click.echo(f"\nPNG Backend: {pillow_backend()}")
+    
     click.echo("\nVisual Effects (PNG):")
     effects_list = ["shadow", "glow", "gradient", "stripe", "blur"]
     for eff in effects_list:
@@ -723,7 +1021,7 @@ def preview(text, font, color):
     """Preview banner in terminal before generating"""
     banner = ascii_banner(text, font=font, colorize=True, color=color)
     
-    if console:
+    if _import_rich():
         console.print(Panel(banner, title="[bold cyan]Banner Preview[/bold cyan]", 
                           border_style="cyan"))
     else:
@@ -777,51 +1075,36 @@ def palette(name, bg, accent, text, muted, save):
 @click.option("--out", "-o", default="banner_config", help="output filename (no extension)")
 def example(format, out):
     """Generate example configuration file for batch processing"""
-    examples = [
-        {
-            "kind": "svg",
-            "text": "BannerForge",
-            "subtitle": "Ultimate Banner Creator",
-            "width": 1200,
-            "height": 300,
-            "palette": "stealth",
-            "style": "wave",
-            "animated": False
-        },
-        {
-            "kind": "png",
-            "text": "Tech Conference 2025",
-            "subtitle": "Innovation & Future",
-            "width": 1920,
-            "height": 400,
-            "palette": "neon",
-            "effects": ["glow", "shadow"]
-        },
-        {
-            "kind": "ascii",
-            "text": "Welcome",
-            "font": "slant"
-        },
-        {
-            "kind": "svg",
-            "text": "Open Source",
-            "subtitle": "Built by the Community",
-            "palette": "forest",
-            "style": "geometric",
-            "animated": True
-        }
-    ]
-    
     filename = f"{out}.{format}"
     
-    with open(filename, 'w', encoding='utf-8') as f:
-        if format == 'yaml':
-            if yaml is None:
-                click.echo("PyYAML not installed. Install: pip install pyyaml")
-                return
-            yaml.dump(examples, f, default_flow_style=False, sort_keys=False)
-        else:
-            json.dump(examples, f, indent=2)
+    # Serialize fully in memory, then write the encoded payload once
+    if format == 'yaml':
+        if not _import_yaml():
+            click.echo("PyYAML not installed. Install: pip install pyyaml")
+            return
+        payload = yaml.dump(EXAMPLE_CONFIGS, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+    else:
+        payload = json.dumps(EXAMPLE_CONFIGS, indent=2)
+    
+    # Write beside the target and rename over it so a killed run never
+    # leaves a truncated config behind. Resolve symlinks first so the link
+    # itself survives, and keep an existing file's mode; a new file gets
+    # 0666 minus the umask, as with a plain open()
+    target = os.path.realpath(filename)
+    try:
+        mode = os.stat(target).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    tmp = f"{target}.{os.urandom(4).hex()}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        _write_fd(fd, payload.encode("utf-8"))
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
     
     click.echo(f"✓ Created example config: {filename}")
     click.echo(f"  Run with: bannerforge batch {filename}")
@@ -832,26 +1115,26 @@ def example(format, out):
               default="svg", help="output type")
 def quick(text, type):
     """Quick banner generation with defaults"""
-    timestamp = datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    safe_name = text.replace(' ', '_')[:30]
+    safe_name = text[:30].translate(_SAFE_NAME_TABLE)
+    pal = get_palette()
+    do_all = type == "all"
+    targets = {"ascii", "svg", "png"} if do_all else {type}
     
-    if type == "ascii" or type == "all":
+    if "ascii" in targets:
         banner = ascii_banner(text, colorize=True)
         click.echo(banner)
-        if type == "all":
+        if do_all:
             with open(f"{safe_name}_quick.txt", 'w') as f:
-                import re
-                clean = re.sub(r'\033\[[0-9;]+m', '', banner)
-                f.write(clean)
+                f.write(strip_ansi(banner))
     
-    if type == "svg" or type == "all":
+    if "svg" in targets:
         filename = f"{safe_name}_quick.svg"
-        write_svg(filename, text, None, palette=get_palette())
+        write_svg(filename, text, None, palette=pal)
         click.echo(f"✓ SVG: {filename}")
     
-    if type == "png" or type == "all":
+    if "png" in targets:
         filename = f"{safe_name}_quick.png"
-        render_png_text(filename, text, palette=get_palette(), effects=["shadow"])
+        render_png_text(filename, text, palette=pal, effects=["shadow"])
         click.echo(f"✓ PNG: {filename}")
 
 # ==================== MAIN ====================